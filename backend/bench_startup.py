@@ -0,0 +1,47 @@
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent
+RUNS = 10
+
+# Each run is a fresh interpreter, so nothing is warm in sys.modules
+IMPORT_SNIPPET = (
+    "import sys, main; "
+    "heavy = [m for m in ('pandas', 'numpy', 'oandapyV20', 'uvicorn') if m in sys.modules]; "
+    "print(','.join(heavy))"
+)
+
+
+def time_import(snippet: str) -> tuple[float, str]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", snippet],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    return time.perf_counter() - start, result.stdout.strip()
+
+
+def bench_cold_start(runs: int = RUNS) -> dict:
+    baseline = [time_import("pass")[0] for _ in range(runs)]
+    samples = []
+    heavy = ""
+    for _ in range(runs):
+        elapsed, heavy = time_import(IMPORT_SNIPPET)
+        samples.append(elapsed)
+    interpreter = statistics.median(baseline)
+    return {
+        "runs": runs,
+        "interpreter_ms": round(interpreter * 1000, 1),
+        "import_main_ms": round(statistics.median(samples) * 1000, 1),
+        "import_main_net_ms": round((statistics.median(samples) - interpreter) * 1000, 1),
+        "heavy_modules_loaded": heavy.split(",") if heavy else [],
+    }
+
+
+if __name__ == "__main__":
+    results = bench_cold_start()
+    for name, value in results.items():
+        print(f"[BENCH] {name}: {value}")
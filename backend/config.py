@@ -1,2 +1,7 @@
 OANDA_ACCOUNT_ID = '0000'
 OANDA_API_KEY = '0000'
+
+# (instrument, granularity) pairs whose candles and default indicators are
+# preloaded in the background when the API starts, e.g. [("XAU_USD", "M5")].
+# Off by default so boots, reloads and tests never call OANDA.
+WARMUP_PAIRS = []
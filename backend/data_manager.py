@@ -1,10 +1,58 @@
+import threading
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
-import oandapyV20
-import oandapyV20.endpoints.instruments as instruments
 import config
 
-client = oandapyV20.API(access_token=config.OANDA_API_KEY, environment="practice")
+_client = None
+_client_lock = threading.Lock()
+
+# Raw candles keyed by (instrument, start_date, candles, granularity) and
+# indicator frames keyed by (candle key, rsi_period, bb_period, bb_std_mult).
+# Frames are copied on the way in and out since callers add columns in place.
+# Both are small LRUs since the keys come straight from request parameters.
+CACHE_MAXSIZE = 8
+_candle_cache = OrderedDict()
+_indicator_cache = OrderedDict()
+_cache_lock = threading.Lock()
+# Per-key locks so concurrent requests for the same candles share one fetch
+_fetch_locks = {}
+
+
+def get_client():
+    """
+    Returns the shared OANDA client, constructing it on first use so that
+    importing this module never touches oandapyV20 or the network.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import oandapyV20
+                _client = oandapyV20.API(access_token=config.OANDA_API_KEY, environment="practice")
+    return _client
+
+
+def _cache_get(cache: OrderedDict, key) -> pd.DataFrame | None:
+    with _cache_lock:
+        if key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key].copy()
+
+
+def _cache_put(cache: OrderedDict, key, df: pd.DataFrame) -> None:
+    with _cache_lock:
+        cache[key] = df.copy()
+        cache.move_to_end(key)
+        while len(cache) > CACHE_MAXSIZE:
+            cache.popitem(last=False)
+
+
+def clear_caches() -> None:
+    with _cache_lock:
+        _candle_cache.clear()
+        _indicator_cache.clear()
 
 
 class DataManager:
@@ -44,9 +92,43 @@ class InstrumentDataFrame:
         
         self.dataframe = None
         self.built_df = False
+        # Only frames holding every requested candle are cached; a short frame
+        # means the range reached the present and newer candles are still due.
+        self.cacheable = False
         self.build_dataframe()
-    
+
+    @property
+    def cache_key(self) -> tuple:
+        return (self.instrument, self.start_date, self.candles_to_load, self.granularity)
+
     def build_dataframe(self):
+        key = self.cache_key
+        with _cache_lock:
+            fetch_lock = _fetch_locks.setdefault(key, threading.Lock())
+        try:
+            with fetch_lock:
+                cached = _cache_get(_candle_cache, key)
+                if cached is not None:
+                    self.dataframe = cached
+                    self.built_df = 1
+                    self.cacheable = True
+                    return
+                df = self.fetch_candles()
+                if df is None:
+                    return pd.DataFrame()
+                self.dataframe = df
+                self.built_df = 1
+                self.cacheable = len(df) == self.candles_to_load
+                if self.cacheable:
+                    _cache_put(_candle_cache, key, df)
+        finally:
+            with _cache_lock:
+                if _fetch_locks.get(key) is fetch_lock:
+                    del _fetch_locks[key]
+
+    def fetch_candles(self) -> pd.DataFrame | None:
+        import oandapyV20.endpoints.instruments as instruments
+
         MAX_COUNT = 4000
         num_candles=self.candles_to_load
         candles_remaining = num_candles
@@ -60,7 +142,7 @@ class InstrumentDataFrame:
             batch_size = min(MAX_COUNT, candles_remaining)
             params = {"granularity": granularity, "price": "BAM", "count": batch_size, "from": from_time.strftime("%Y-%m-%dT%H:%M:%SZ")}
             r = instruments.InstrumentsCandles(instrument=self.instrument, params=params)
-            client.request(r)
+            get_client().request(r)
             api_request_count += 1
             print(f"[API] Request #{api_request_count} — batch_size={batch_size}, from={from_time.strftime('%Y-%m-%dT%H:%M:%SZ')}")
             candles = r.response.get("candles", [])
@@ -92,12 +174,11 @@ class InstrumentDataFrame:
                 break
 
         if not all_records:
-            return pd.DataFrame()
+            return None
         df = pd.concat(all_records).drop_duplicates(subset="time").sort_values("time").reset_index(drop=True)
         if len(df) > num_candles:
             df = df.iloc[-num_candles:].reset_index(drop=True)
-        self.dataframe = df
-        self.built_df = 1
+        return df
     
     def add_rsi(self, rsi_period: int) -> pd.DataFrame:
         df = self.dataframe
@@ -159,8 +240,16 @@ class InstrumentDataFrame:
 
 
     def add_indicators(self, rsi_period: int, bb_period: int, bb_std_mult: float) -> pd.DataFrame:
+        key = (self.cache_key, rsi_period, bb_period, bb_std_mult)
+        cached = _cache_get(_indicator_cache, key) if self.cacheable else None
+        if cached is not None:
+            self.dataframe = cached
+            return self.dataframe
+
         self.add_rsi(rsi_period)
         self.add_bollinger_bands(bb_period, bb_std_mult, bb_width_avg_period=100)
         self.add_atr_sma(periods=(14, 80))
         self.add_relative_volume(vol_period=50)
-        return self.dataframe
\ No newline at end of file
+        if self.cacheable:
+            _cache_put(_indicator_cache, key, self.dataframe)
+        return self.dataframe
@@ -1,15 +1,20 @@
-import numpy as np
-import pandas as pd
+import threading
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-import oandapyV20
-import oandapyV20.endpoints.instruments as instruments
 import config
-import uvicorn
-from data_manager import DataManager, InstrumentDataFrame
 from leaderboard import add_entry, get_entries, delete_all, delete_one
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up in the background so an unreachable OANDA never delays boot
+    if config.WARMUP_PAIRS:
+        threading.Thread(target=warm_up_caches, daemon=True).start()
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 CHECK_INTERVAL_HIST = 0 #0.005
@@ -41,6 +46,42 @@ app.add_middleware(
 )
 
 
+GRANULARITY_MINUTES = {"M1": 1, "M5": 5, "M10": 10, "M15": 15, "M30": 30, "H1": 60, "H4": 240, "D": 1440}
+
+
+def default_start_date() -> str:
+    # Truncated to the day so repeated requests (and the warm-up) share cache keys
+    from datetime import datetime, timedelta, timezone
+    return (datetime.now(timezone.utc) - timedelta(days=365)).strftime("%Y-%m-%dT00:00:00Z")
+
+
+def load_data(instrument, start_date, num_candles, granularity, rsi_period, bb_period, bb_std):
+    # pandas/numpy/oandapyV20 are only needed once data is actually requested
+    from data_manager import DataManager
+
+    entry_mins = GRANULARITY_MINUTES.get(granularity, 5)
+    trend_mins = GRANULARITY_MINUTES.get(GRANULARITY_TREND, 60)
+    ratio = trend_mins // entry_mins
+    num_candles_trend = max(200, num_candles // ratio) if ratio > 0 else 200
+
+    dataManager = DataManager("GoldBotProfile")
+
+    dataManager.add_instrument_dataframe(instrument, start_date, num_candles, granularity, "XAUD_M5_ENTRY")
+    dataManager.add_instrument_dataframe(instrument, start_date, num_candles_trend, GRANULARITY_TREND, "XAUD_H1_TREND")
+    dataManager["XAUD_M5_ENTRY"].add_indicators(rsi_period, bb_period, bb_std)
+    return dataManager
+
+
+def warm_up_caches():
+    start_date = default_start_date()
+    for instrument, granularity in config.WARMUP_PAIRS:
+        try:
+            load_data(instrument, start_date, CANDLES_TO_LOAD_HIST, granularity, RSI_PERIOD, BB_PERIOD, BB_STD)
+            print(f"[WARMUP] Cached {instrument} {granularity}")
+        except Exception as e:
+            print(f"[WARMUP] Skipped {instrument} {granularity}: {e}")
+
+
 # ==============================
 # API ENDPOINT
 # ==============================
@@ -64,27 +105,17 @@ def run_backtest(
     trading_end_time: str = Query("17:00"),
     sl_multiplier: float = Query(1.0)
 ):
-    from datetime import datetime, timedelta, timezone
+    import numpy as np
     if start_date is None:
-        start_date = (datetime.now(timezone.utc) - timedelta(days=365)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        start_date = default_start_date()
     else:
         start_date = f"{start_date}T00:00:00Z"
 
     print(f"[REQUEST] Frontend request received — num_candles={num_candles}, granularity={granularity}")
 
-    GRANULARITY_MINUTES = {"M1": 1, "M5": 5, "M10": 10, "M15": 15, "M30": 30, "H1": 60, "H4": 240, "D": 1440}
-    entry_mins = GRANULARITY_MINUTES.get(granularity, 5)
-    trend_mins = GRANULARITY_MINUTES.get(GRANULARITY_TREND, 60)
-    ratio = trend_mins // entry_mins
-    num_candles_trend = max(200, num_candles // ratio) if ratio > 0 else 200
-
-    dataManager = DataManager("GoldBotProfile")
-
-    dataManager.add_instrument_dataframe(INSTRUMENT, start_date, num_candles, granularity, "XAUD_M5_ENTRY")
-    dataManager.add_instrument_dataframe(INSTRUMENT, start_date, num_candles_trend, GRANULARITY_TREND, "XAUD_H1_TREND")
     # Load Data
+    dataManager = load_data(INSTRUMENT, start_date, num_candles, granularity, rsi_period, bb_period, bb_std)
     total_profit = 0.0
-    dataManager["XAUD_M5_ENTRY"].add_indicators(rsi_period, bb_period, bb_std)
     df_trend = dataManager["XAUD_H1_TREND"].dataframe
     df_entry = dataManager["XAUD_M5_ENTRY"].dataframe
     df_trend["EMA200"] = df_trend["close"].ewm(span=200, adjust=False).mean()
@@ -398,4 +429,5 @@ def delete_leaderboard_entry(entry_id: str):
 
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run(app, host="localhost", port=8000)
\ No newline at end of file
@@ -0,0 +1,130 @@
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).parent
+HEAVY_MODULES = ("pandas", "numpy", "oandapyV20", "uvicorn")
+
+
+def test_import_main_skips_heavy_modules():
+    pytest.importorskip("fastapi")
+    snippet = (
+        "import sys, main; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", snippet],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip() == ""
+
+
+class FakeCandles:
+    def __init__(self, instrument, params):
+        self.instrument = instrument
+        self.params = params
+        self.response = None
+
+
+class FakeClient:
+    def __init__(self, available):
+        self.available = available
+        self.requests = 0
+
+    def request(self, r):
+        self.requests += 1
+        count = min(r.params["count"], self.available)
+        candles = []
+        for i in range(count):
+            price = {"o": "1", "h": "2", "l": "0.5", "c": str(1 + i)}
+            candles.append({
+                "time": f"2025-01-01T00:{i:02d}:00Z", "complete": True,
+                "mid": price, "ask": price, "bid": price, "volume": 100,
+            })
+        r.response = {"candles": candles}
+
+
+@pytest.fixture
+def data_manager(monkeypatch):
+    pytest.importorskip("pandas")
+    endpoints = types.ModuleType("oandapyV20.endpoints")
+    endpoints.instruments = types.ModuleType("oandapyV20.endpoints.instruments")
+    endpoints.instruments.InstrumentsCandles = FakeCandles
+    oanda = types.ModuleType("oandapyV20")
+    oanda.endpoints = endpoints
+    monkeypatch.setitem(sys.modules, "oandapyV20", oanda)
+    monkeypatch.setitem(sys.modules, "oandapyV20.endpoints", endpoints)
+    monkeypatch.setitem(sys.modules, "oandapyV20.endpoints.instruments", endpoints.instruments)
+
+    import data_manager
+    data_manager.clear_caches()
+    yield data_manager
+    data_manager.clear_caches()
+
+
+def test_candle_cache_hit_and_miss(data_manager, monkeypatch):
+    client = FakeClient(available=10)
+    monkeypatch.setattr(data_manager, "_client", client)
+
+    first = data_manager.InstrumentDataFrame("XAU_USD", "2025-01-01T00:00:00Z", 10, "M5")
+    first.add_indicators(3, 3, 2)
+    first.dataframe["EMA200"] = 0.0
+    second = data_manager.InstrumentDataFrame("XAU_USD", "2025-01-01T00:00:00Z", 10, "M5")
+    assert client.requests == 1
+    assert "EMA200" not in second.dataframe.columns
+    assert "RSI" in second.add_indicators(3, 3, 2).columns
+
+    data_manager.InstrumentDataFrame("XAU_USD", "2025-01-01T00:00:00Z", 10, "H1")
+    assert client.requests == 2
+
+    data_manager.clear_caches()
+    data_manager.InstrumentDataFrame("XAU_USD", "2025-01-01T00:00:00Z", 10, "M5")
+    assert client.requests == 3
+
+
+def test_partial_frames_are_not_cached(data_manager, monkeypatch):
+    client = FakeClient(available=5)
+    monkeypatch.setattr(data_manager, "_client", client)
+
+    data_manager.InstrumentDataFrame("XAU_USD", "2025-01-01T00:00:00Z", 10, "M5")
+    data_manager.InstrumentDataFrame("XAU_USD", "2025-01-01T00:00:00Z", 10, "M5")
+    assert client.requests == 2
+
+
+def test_cache_evicts_least_recently_used(data_manager, monkeypatch):
+    client = FakeClient(available=10)
+    monkeypatch.setattr(data_manager, "_client", client)
+    monkeypatch.setattr(data_manager, "CACHE_MAXSIZE", 2)
+
+    for candles in (4, 5, 6):
+        data_manager.InstrumentDataFrame("XAU_USD", "2025-01-01T00:00:00Z", candles, "M5")
+    assert len(data_manager._candle_cache) == 2
+    data_manager.InstrumentDataFrame("XAU_USD", "2025-01-01T00:00:00Z", 4, "M5")
+    assert client.requests == 4
+
+
+def test_concurrent_fetches_share_one_request(data_manager, monkeypatch):
+    import threading
+    import time
+
+    class SlowClient(FakeClient):
+        def request(self, r):
+            time.sleep(0.1)
+            super().request(r)
+
+    client = SlowClient(available=10)
+    monkeypatch.setattr(data_manager, "_client", client)
+
+    threads = [
+        threading.Thread(target=data_manager.InstrumentDataFrame, args=("XAU_USD", "2025-01-01T00:00:00Z", 10, "M5"))
+        for _ in range(2)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert client.requests == 1
+    assert data_manager._fetch_locks == {}